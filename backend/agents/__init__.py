@@ -5,16 +5,85 @@ Exports:
 - create_conversation_agent(): Build main agent
 - create_research_agent(): Build research specialist
 - create_assist_agent(): Build documentation assistant
+- acreate_*_agent(): Async counterparts for concurrent startup
+
+Submodules are imported lazily (PEP 562): importing `agents` no longer
+pulls in the LanceDB, MCP, and embedder stacks for agents that are
+never used in the current process.
 """
 
-from agents.base_agent import BaseAgentBuilder
-from agents.conversation_agent import create_conversation_agent
-from agents.research_agent import create_research_agent
-from agents.assist_agent import create_assist_agent
+import importlib
+import sqlite3
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _get_db(db_file: str):
+    """
+    Get the shared SqliteDb instance for a database file.
+
+    Each SqliteDb construction builds its own SQLAlchemy engine and
+    connection pool; with all three agents pointing at the same file
+    that meant three pools contending for the same database and
+    needless 'database is locked' risk. Memoizing per db_file gives
+    every agent the same engine/pool.
+
+    WAL journal mode is enabled on first open (it persists in the file)
+    so concurrent readers are not blocked by the writer.
+
+    Args:
+        db_file (str): SQLite database file path
+
+    Returns:
+        SqliteDb: Shared database handle for that file
+    """
+    # Local import keeps agno (and SQLAlchemy) out of package import time
+    from agno.db.sqlite import SqliteDb
+
+    try:
+        conn = sqlite3.connect(db_file)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.close()
+    except sqlite3.Error:
+        # Pragmas are an optimization only — never block agent creation
+        pass
+    return SqliteDb(db_file=db_file)
+
+
+# Map of public names to the submodule that defines them.
+# Each submodule transitively imports a heavy dependency stack
+# (LanceDB + embedders, MCP, model SDKs), so resolution is deferred
+# until a name is actually requested.
+_LAZY_EXPORTS = {
+    "BaseAgentBuilder": "agents.base_agent",
+    "create_conversation_agent": "agents.conversation_agent",
+    "acreate_conversation_agent": "agents.conversation_agent",
+    "create_research_agent": "agents.research_agent",
+    "acreate_research_agent": "agents.research_agent",
+    "create_assist_agent": "agents.assist_agent",
+    "acreate_assist_agent": "agents.assist_agent",
+}
+
+
+def __getattr__(name: str):
+    """Resolve exported names lazily on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BaseAgentBuilder",
     "create_conversation_agent",
     "create_research_agent",
     "create_assist_agent",
+    "acreate_conversation_agent",
+    "acreate_research_agent",
+    "acreate_assist_agent",
 ]
@@ -32,15 +32,165 @@ Use Cases:
 """
 
 import asyncio
+import copy
+import os
 
 from agno.agent import Agent
-from agno.db.sqlite import SqliteDb
 from agno.knowledge.embedder.openai import OpenAIEmbedder
 from agno.knowledge.knowledge import Knowledge
-from agno.vectordb.lancedb import LanceDb, SearchType
+from agno.vectordb.lancedb import SearchType
 
+from agents import _get_db
+from agents.hybrid_search import AdaptiveAlphaLanceDb
+from agents.micro_batch_embedder import MicroBatchEmbedder
+from agents.semantic_cache import SemanticQueryCache
 from config import ASSIST_AGENT_CONFIG, get_config
 from config.model_provider import get_model
+from utils import get_logger
+
+logger = get_logger(__name__)
+
+# IVF_PQ tuning for 1536-dim text-embedding-3-small vectors.
+# PQ compresses 6 KB FP32 rows ~32x, so ANN traversal streams far fewer
+# bytes per query; below this row count a flat scan is already fast and
+# an index would only hurt recall.
+ANN_INDEX_MIN_ROWS = 10_000
+ANN_NUM_PARTITIONS = 256
+ANN_NUM_SUB_VECTORS = 96  # Must divide the 1536 embedding dims
+
+
+def _warm_page_cache(vector_db_dir: str) -> None:
+    """
+    Ask the kernel to prefetch the LanceDB data files into page cache.
+
+    On a cold start the first query pays disk-seek latency for every
+    Lance page it touches. posix_fadvise(POSIX_FADV_WILLNEED) starts
+    readahead at agent-creation time instead, so the first query lands
+    in page cache. The walk covers everything under the table directory,
+    including the ANN index files in its _indices/ subtree, so the IVF
+    centroid pages are prefetched along with the data. No-op on
+    platforms without posix_fadvise (Windows, macOS) and on any
+    per-file error.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for dirpath, _, filenames in os.walk(vector_db_dir):
+        for filename in filenames:
+            try:
+                fd = os.open(os.path.join(dirpath, filename), os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                continue
+
+
+def _maybe_create_ann_index(vector_db: AdaptiveAlphaLanceDb) -> None:
+    """
+    Create an IVF_PQ index on the knowledge table once it is large enough.
+
+    Product quantization shrinks stored vectors ~32x with <2% recall
+    loss, cutting the bytes read per ANN query (the memory-bound part of
+    vector search) proportionally. Skipped entirely for small tables
+    where a flat scan is cheaper than the recall trade-off, and — since
+    lancedb's create_index defaults to replace=True and would rebuild
+    from scratch — also whenever the vector column is already indexed,
+    so agent creation stays cheap on every start after the first build.
+
+    Failures are non-fatal: search falls back to the unindexed path.
+    """
+    try:
+        table = vector_db.table
+        if table is None or table.count_rows() < ANN_INDEX_MIN_ROWS:
+            return
+        for index in table.list_indices():
+            if "vector" in tuple(getattr(index, "columns", ())):
+                return  # Already indexed — don't rebuild on every start
+        table.create_index(
+            metric="cosine",
+            num_partitions=ANN_NUM_PARTITIONS,
+            num_sub_vectors=ANN_NUM_SUB_VECTORS,
+            index_type="IVF_PQ",
+        )
+        logger.info("Created IVF_PQ index on assist knowledge table")
+    except Exception as e:
+        logger.warning("Could not create ANN index: %s", e)
+
+
+def _with_semantic_cache(agent: Agent, embedder=None) -> Agent:
+    """
+    Wrap an agent's run entry points with a semantic query cache.
+
+    This is a thin middleware in front of `agent.run()` / `agent.arun()`:
+    1. Embed the incoming query once
+    2. If cosine similarity to a cached query >= threshold, return the
+       stored response directly (skips retrieval AND generation)
+    3. Otherwise run the agent normally and cache (vector, response)
+
+    Only plain-string, non-streaming runs are cached. Streamed runs
+    (stream=True) return one-shot iterators that AgentOS consumes
+    directly — caching one would replay an exhausted generator, and
+    wrapping arun in a coroutine would break the `async for` AgentOS
+    does over its return value — so they pass through untouched, as
+    does any non-string input (structured input, images, etc.).
+
+    Args:
+        agent: Assist agent to wrap
+        embedder: Embedder for cache lookups — pass the agent's own
+            (micro-batching) embedder so each uncached query is
+            embedded once and lookups share its vector LRU
+
+    Returns:
+        Agent: Same agent instance with cached run/arun methods
+    """
+    cache = SemanticQueryCache(embedder=embedder)
+    original_run = agent.run
+    original_arun = agent.arun
+
+    def replay(cached, kwargs):
+        # The cached RunOutput carries the originating run's session/run
+        # ids; replaying it verbatim would leak them into whatever
+        # session asked the similar question. Hand back a shallow copy
+        # stamped with the caller's session and no run id instead.
+        response = copy.copy(cached)
+        if hasattr(response, "session_id"):
+            response.session_id = kwargs.get("session_id")
+        if hasattr(response, "run_id"):
+            response.run_id = None
+        return response
+
+    def cached_run(input, **kwargs):
+        if kwargs.get("stream") or not isinstance(input, str):
+            return original_run(input, **kwargs)
+        vector, cached = cache.get(input)
+        if cached is not None:
+            return replay(cached, kwargs)
+        response = original_run(input, **kwargs)
+        cache.put(input, vector, response)
+        return response
+
+    async def _cached_arun(input, **kwargs):
+        # Embedding + top-1 scan are blocking; keep them off the event loop
+        vector, cached = await asyncio.to_thread(cache.get, input)
+        if cached is not None:
+            return replay(cached, kwargs)
+        response = await original_arun(input, **kwargs)
+        cache.put(input, vector, response)
+        return response
+
+    def cached_arun(input, **kwargs):
+        # Plain def, like agno's own arun: stream=True calls get the
+        # original async iterator back (AgentOS `async for`s over it
+        # without awaiting), non-streaming calls get a coroutine
+        if kwargs.get("stream") or not isinstance(input, str):
+            return original_arun(input, **kwargs)
+        return _cached_arun(input, **kwargs)
+
+    agent.run = cached_run
+    agent.arun = cached_arun
+    agent.semantic_cache = cache
+    return agent
 
 
 def create_assist_agent() -> Agent:
@@ -52,7 +202,11 @@ def create_assist_agent() -> Agent:
     2. Retrieve: Gets relevant documentation chunks from LanceDB
     3. Context: Combines retrieved docs with conversation history
     4. Generate: LLM creates documentation-grounded answer
-    
+
+    A semantic query cache sits in front of this pipeline: questions
+    near-identical to an earlier one (cosine similarity >= 0.92) replay
+    the cached answer and skip steps 1-4 entirely.
+
     Configuration:
     - Uses ASSIST_AGENT_CONFIG from constants
     - Knowledge base with hybrid search (semantic + keyword)
@@ -73,36 +227,66 @@ def create_assist_agent() -> Agent:
     """
     config = get_config()
 
-    # Setup database connection for conversation history
-    db = SqliteDb(db_file=config.database.db_file)
+    # Shared database connection (one engine/pool across all agents)
+    db = _get_db(config.database.db_file)
+
+    # One embedder shared by the knowledge base and the semantic cache:
+    # concurrent embed calls are coalesced into one API request, and a
+    # query embedded for the cache lookup is served from the same LRU
+    # when the knowledge search embeds it again
+    embedder = MicroBatchEmbedder(OpenAIEmbedder(id="text-embedding-3-small"))
 
     # Create knowledge base with hybrid search (semantic + keyword)
     try:
         knowledge = Knowledge(
-            vector_db=LanceDb(
-                uri="tmp/lancedb",  # Vector DB storage location
+            vector_db=AdaptiveAlphaLanceDb(
+                uri=config.database.vector_db_dir,  # Persistent storage location
                 table_name="agno_assist_knowledge",
                 search_type=SearchType.hybrid,  # Combines semantic + keyword search
-                embedder=OpenAIEmbedder(id="text-embedding-3-small"),
+                embedder=embedder,
             ),
         )
-        print("[INFO] Assist agent created with RAG enabled (knowledge base ready)")
+        # Quantize vector storage once the corpus is big enough to benefit
+        _maybe_create_ann_index(knowledge.vector_db)
+        # Prefetch Lance files (data + index) so the first query hits
+        # page cache
+        _warm_page_cache(config.database.vector_db_dir)
+        logger.info("Assist agent created with RAG enabled (knowledge base ready)")
     except Exception as e:
-        print(f"[WARNING] Could not create knowledge base: {e}")
-        print("[INFO] Creating assist agent WITHOUT RAG (basic mode)")
+        logger.warning("Could not create knowledge base: %s", e)
+        logger.info("Creating assist agent WITHOUT RAG (basic mode)")
         knowledge = None
 
     # Create assist agent with RAG capabilities
-    return Agent(
-        id=ASSIST_AGENT_CONFIG["db_table"],
-        name=ASSIST_AGENT_CONFIG["name"],
+    agent = Agent(
+        id=ASSIST_AGENT_CONFIG.db_table,
+        name=ASSIST_AGENT_CONFIG.name,
         model=get_model(),
         db=db,
         knowledge=knowledge,  # Enable RAG (None if failed)
-        description=ASSIST_AGENT_CONFIG["description"],
-        instructions=ASSIST_AGENT_CONFIG["instructions"],
+        description=ASSIST_AGENT_CONFIG.description,
+        # agno's system-message builder accepts str or list only; a
+        # tuple falls through both branches and is silently dropped
+        instructions=list(ASSIST_AGENT_CONFIG.instructions),
         add_history_to_context=True,
         num_history_runs=3,
         add_datetime_to_context=True,
         markdown=True,
     )
+
+    # Short-circuit repeated/near-duplicate questions before RAG + LLM
+    return _with_semantic_cache(agent, embedder)
+
+
+async def acreate_assist_agent() -> Agent:
+    """
+    Async counterpart of create_assist_agent().
+
+    Runs the blocking construction work (SQLite open, LanceDB open,
+    embedder setup) in a worker thread so the runtime can build all
+    agents concurrently at startup instead of serially.
+
+    Returns:
+        Agent: Assist agent instance with knowledge base
+    """
+    return await asyncio.to_thread(create_assist_agent)
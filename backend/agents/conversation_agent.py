@@ -19,9 +19,11 @@ Database:
 - Shared SQLite file with other agents
 """
 
+import asyncio
+
 from agno.agent import Agent
-from agno.db.sqlite import SqliteDb
 
+from agents import _get_db
 from config import CONVERSATION_AGENT_CONFIG, get_config
 from config.model_provider import get_model
 
@@ -50,18 +52,34 @@ def create_conversation_agent() -> Agent:
     """
     config = get_config()
 
-    # Setup database connection
-    db = SqliteDb(db_file=config.database.db_file)
+    # Shared database connection (one engine/pool across all agents)
+    db = _get_db(config.database.db_file)
 
     # Create conversation agent with direct Agent() constructor
     return Agent(
-        id=CONVERSATION_AGENT_CONFIG["db_table"],
-        name=CONVERSATION_AGENT_CONFIG["name"],
+        id=CONVERSATION_AGENT_CONFIG.db_table,
+        name=CONVERSATION_AGENT_CONFIG.name,
         model=get_model(),
         db=db,
-        description=CONVERSATION_AGENT_CONFIG["description"],
-        instructions=CONVERSATION_AGENT_CONFIG["instructions"],
+        description=CONVERSATION_AGENT_CONFIG.description,
+        # agno's system-message builder accepts str or list only; a
+        # tuple falls through both branches and is silently dropped
+        instructions=list(CONVERSATION_AGENT_CONFIG.instructions),
         add_history_to_context=True,
         num_history_runs=3,
         markdown=True,
     )
+
+
+async def acreate_conversation_agent() -> Agent:
+    """
+    Async counterpart of create_conversation_agent().
+
+    Runs the blocking construction work (SQLite open, model client setup)
+    in a worker thread so the runtime can build all agents concurrently
+    at startup instead of serially.
+
+    Returns:
+        Agent: Conversation agent instance configured and ready to use
+    """
+    return await asyncio.to_thread(create_conversation_agent)
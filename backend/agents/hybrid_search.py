@@ -0,0 +1,183 @@
+"""
+Adaptive Hybrid Search Module
+
+Tuned LanceDB hybrid search for the Assist agent's knowledge base.
+
+LanceDB's default hybrid search merges the semantic (ANN) and keyword
+(BM25) result lists with a fixed, untuned weight. A single weight is the
+wrong trade-off across query shapes:
+- Short keyword-ish queries ("AgentOS", "MCP url") are answered best by
+  BM25 exact matching
+- Long natural-language questions are answered best by semantic search
+
+This module provides AdaptiveAlphaLanceDb, a LanceDb subclass that
+installs an agno reranker re-scoring the fused candidates per query:
+each document's score blends its fused-search rank (the semantic-leaning
+signal) with its lexical term overlap against the query, weighted by
+alpha from the query's word count. It also caps the candidate count so
+fewer chunks reach the LLM prompt: fewer prompt tokens, lower cost and
+latency.
+
+Alpha schedule (semantic weight):
+- <= 2 words  -> 0.3  (lean on lexical overlap)
+- <= 4 words  -> 0.6  (balanced)
+-  > 4 words  -> 0.85 (lean on the fused semantic order)
+
+Usage:
+    from agents.hybrid_search import AdaptiveAlphaLanceDb
+
+    vector_db = AdaptiveAlphaLanceDb(
+        uri=config.database.vector_db_dir,
+        table_name="agno_assist_knowledge",
+        search_type=SearchType.hybrid,
+        embedder=OpenAIEmbedder(id="text-embedding-3-small"),
+    )
+"""
+
+from typing import List, Optional
+
+from agno.vectordb.lancedb import LanceDb
+
+# agno's vectordb search path calls self.reranker.rerank(query=...,
+# documents=List[Document]) on the fused results; the base class has
+# moved between agno releases, and the contract is just that one method
+try:
+    from agno.knowledge.reranker.base import Reranker as _RerankerBase
+except ImportError:
+    try:
+        from agno.reranker.base import Reranker as _RerankerBase
+    except ImportError:
+        _RerankerBase = object
+
+# ============================================================================
+# Hybrid Search Tuning Constants
+# ============================================================================
+
+ALPHA_SHORT_QUERY = 0.3    # <= 2 words: mostly lexical overlap
+ALPHA_MEDIUM_QUERY = 0.6   # <= 4 words: balanced
+ALPHA_LONG_QUERY = 0.85    # > 4 words: mostly the fused semantic order
+
+SHORT_QUERY_WORDS = 2
+MEDIUM_QUERY_WORDS = 4
+
+MAX_CANDIDATES = 8  # Cap on retrieved chunks handed to the LLM
+
+
+def alpha_for_query(query: str) -> float:
+    """
+    Pick the blend weight (semantic share) for a query.
+
+    Short queries are usually keyword lookups and score better on exact
+    term matching; long natural-language questions score better on the
+    embedding-driven fused order.
+
+    Args:
+        query: User query string
+
+    Returns:
+        float: Alpha in [0, 1]; 1.0 means purely the fused order
+    """
+    words = len(query.split())
+    if words <= SHORT_QUERY_WORDS:
+        return ALPHA_SHORT_QUERY
+    if words <= MEDIUM_QUERY_WORDS:
+        return ALPHA_MEDIUM_QUERY
+    return ALPHA_LONG_QUERY
+
+
+def _lexical_overlap(query_terms: set, content: str) -> float:
+    """
+    Fraction of query terms appearing in a document's content.
+
+    A deliberately cheap keyword signal: no tokenizer, no term
+    weighting — over <= MAX_CANDIDATES short chunks it separates
+    exact-match hits from purely-semantic neighbours, which is all the
+    blend needs.
+
+    Args:
+        query_terms: Lowercased query terms
+        content: Document content (any case)
+
+    Returns:
+        float: Overlap in [0, 1]
+    """
+    if not query_terms:
+        return 0.0
+    content = content.lower()
+    return sum(1 for term in query_terms if term in content) / len(query_terms)
+
+
+class AdaptiveAlphaReranker(_RerankerBase):
+    """
+    Stateless reranker blending fused order with lexical overlap.
+
+    agno applies this to the documents its hybrid search returns. Each
+    document is re-scored as
+
+        alpha * 1/(rank+1) + (1 - alpha) * lexical_overlap
+
+    where rank is the document's position in the fused results (so the
+    embedding-driven order is preserved as a signal, strongest for long
+    queries) and alpha comes from the query length. Carries no state, so
+    one shared instance is safe under concurrent searches.
+    """
+
+    def rerank(self, query: str, documents: List) -> List:
+        """
+        Re-order fused search results with the per-query alpha blend.
+
+        Args:
+            query: Query string the documents were retrieved for
+            documents: Fused results, best-first
+
+        Returns:
+            List: Same documents, re-ordered by the blended score
+        """
+        if len(documents) < 2:
+            return documents
+
+        alpha = alpha_for_query(query)
+        query_terms = set(query.lower().split())
+
+        def blended_score(indexed: tuple) -> float:
+            rank, document = indexed
+            fused = 1.0 / (rank + 1)
+            overlap = _lexical_overlap(query_terms, document.content or "")
+            return alpha * fused + (1.0 - alpha) * overlap
+
+        ordered = sorted(enumerate(documents), key=blended_score, reverse=True)
+        return [document for _, document in ordered]
+
+
+class AdaptiveAlphaLanceDb(LanceDb):
+    """
+    LanceDb with query-length-adaptive result blending.
+
+    1. Installs an AdaptiveAlphaReranker (unless the caller configured
+       their own), which agno's search path applies to the fused hybrid
+       results — re-weighting them per query between the semantic order
+       and lexical overlap
+    2. Overrides search() to cap the candidate count at MAX_CANDIDATES
+       so the LLM reranks (and pays prompt tokens for) fewer chunks
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if getattr(self, "reranker", None) is None:
+            self.reranker = AdaptiveAlphaReranker()
+
+    def search(self, query: str, limit: Optional[int] = None, *args, **kwargs):
+        """
+        Run search with the candidate cap applied.
+
+        Args:
+            query: Query string
+            limit: Max results (capped at MAX_CANDIDATES)
+
+        Returns:
+            Search results from the underlying LanceDb implementation
+        """
+        if limit is None or limit > MAX_CANDIDATES:
+            limit = MAX_CANDIDATES
+
+        return super().search(query, limit, *args, **kwargs)
@@ -0,0 +1,203 @@
+"""
+Micro-Batching Embedder Module
+
+Coalesces concurrent embedding calls into batched OpenAI requests.
+
+Each agent query normally issues one embeddings API call with a single
+input, paying full per-request TLS/HTTP overhead. Under concurrent chat
+load many of those calls arrive within milliseconds of each other — the
+OpenAI embeddings endpoint accepts up to 2048 inputs per request, so
+they can share one round trip.
+
+MicroBatchEmbedder wraps any agno embedder:
+- Async calls are queued; the queue is flushed when either 10ms elapse
+  or 64 items are waiting, whichever comes first
+- Each caller awaits a Future resolved when its batch returns
+- Inputs are sorted by length inside a batch (shorter together) to
+  minimize provider-side padding waste; results are returned to callers
+  in their original association
+- Sync calls pass straight through (no event loop to batch on)
+- A 4096-entry LRU keyed on the 16-byte prompt hash serves repeated
+  queries without any API call at all
+
+All other attributes (dimensions, id, client, ...) are delegated to the
+wrapped embedder, so it drops into LanceDb(embedder=...) unchanged.
+
+Usage:
+    from agents.micro_batch_embedder import MicroBatchEmbedder
+
+    embedder = MicroBatchEmbedder(OpenAIEmbedder(id="text-embedding-3-small"))
+    vector = await embedder.async_get_embedding("What is Agno?")
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+from utils.hashing import hash_prompt
+
+# ============================================================================
+# Batching Constants
+# ============================================================================
+
+FLUSH_INTERVAL_SECONDS = 0.010  # Coalescing window (10ms)
+MAX_BATCH_SIZE = 64             # Flush immediately at this queue depth
+VECTOR_CACHE_SIZE = 4096        # Cached query-vector entries (LRU)
+
+
+class MicroBatchEmbedder:
+    """
+    Embedder wrapper that micro-batches concurrent async embed calls.
+
+    Acts as a drop-in replacement for the wrapped embedder: sync
+    `get_embedding` passes through, async `async_get_embedding` is
+    coalesced with other in-flight calls into one batched API request.
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            embedder: Underlying agno embedder (e.g. OpenAIEmbedder)
+            flush_interval: Max seconds a call waits for batch-mates
+            max_batch_size: Queue depth that triggers an immediate flush
+        """
+        self._embedder = embedder
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Vector LRU keyed on the 16-byte prompt hash: repeated queries
+        # ("What is Agno?") skip the embeddings round trip entirely.
+        # A plain OrderedDict + lock stands in for an async-aware
+        # lru_cache, which functools does not provide for coroutines.
+        self._vector_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._vector_cache_lock = threading.Lock()
+
+    def _cache_get(self, key: bytes) -> Optional[List[float]]:
+        """Return a cached vector (refreshing recency) or None."""
+        with self._vector_cache_lock:
+            vector = self._vector_cache.get(key)
+            if vector is not None:
+                self._vector_cache.move_to_end(key)
+            return vector
+
+    def _cache_put(self, key: bytes, vector: List[float]) -> None:
+        """Store a vector, evicting the least-recently-used entry at capacity."""
+        with self._vector_cache_lock:
+            self._vector_cache[key] = vector
+            self._vector_cache.move_to_end(key)
+            while len(self._vector_cache) > VECTOR_CACHE_SIZE:
+                self._vector_cache.popitem(last=False)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else (dimensions, id, client, ...) to the wrapped embedder."""
+        return getattr(self._embedder, name)
+
+    # ------------------------------------------------------------------
+    # Sync path — no event loop, no batching opportunity
+    # ------------------------------------------------------------------
+
+    def get_embedding(self, text: str) -> List[float]:
+        """Embed a single text synchronously, consulting the vector LRU first."""
+        key = hash_prompt(text)
+        vector = self._cache_get(key)
+        if vector is None:
+            vector = self._embedder.get_embedding(text)
+            self._cache_put(key, vector)
+        return vector
+
+    # ------------------------------------------------------------------
+    # Async path — micro-batched
+    # ------------------------------------------------------------------
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        """
+        Embed a text, coalescing with other concurrent calls.
+
+        The vector LRU is consulted first — a repeated query returns
+        its cached vector without touching the API. Otherwise the call
+        is queued and resolved when its batch is flushed — after
+        `flush_interval` seconds or as soon as `max_batch_size` calls
+        are waiting.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            List[float]: Embedding vector
+        """
+        cached = self._cache_get(hash_prompt(text))
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._flush_interval, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Take the pending queue and embed it as one batch in a worker thread."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed a drained batch and resolve each caller's Future."""
+        # Sort by text length so same-size inputs share a request slot
+        # (minimizes provider-side padding); order[i] maps back to callers
+        order = sorted(range(len(batch)), key=lambda i: len(batch[i][0]))
+        texts = [batch[i][0] for i in order]
+
+        try:
+            vectors = await asyncio.to_thread(self._embed_batch, texts)
+            for position, vector in zip(order, vectors):
+                text, future = batch[position]
+                self._cache_put(hash_prompt(text), vector)
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a list of texts in one API request where possible.
+
+        Uses the wrapped embedder's OpenAI client directly (the
+        embeddings endpoint accepts batched input); falls back to
+        per-item embedding if the client shape is unexpected.
+
+        Args:
+            texts: Texts to embed, in request order
+
+        Returns:
+            List of embedding vectors, aligned with `texts`
+        """
+        try:
+            response = self._embedder.client.embeddings.create(
+                input=texts,
+                model=self._embedder.id,
+            )
+            return [item.embedding for item in response.data]
+        except Exception:
+            return [self._embedder.get_embedding(text) for text in texts]
@@ -25,14 +25,36 @@ Use Cases:
 - Report generation
 """
 
+import asyncio
+from functools import lru_cache
+
 from agno.agent import Agent
-from agno.db.sqlite import SqliteDb
 from agno.tools.mcp import MCPTools
 
+from agents import _get_db
 from config import RESEARCH_AGENT_CONFIG, get_config
 from config.model_provider import get_model
 
 
+@lru_cache(maxsize=4)
+def _get_mcp_tools(url: str) -> MCPTools:
+    """
+    Get the shared MCPTools instance for an MCP endpoint URL.
+
+    Constructing MCPTools establishes a fresh streamable-http connection
+    (TCP + TLS handshake) each time; memoizing per URL means hot reloads
+    and repeated factory calls reuse the existing keep-alive connection
+    instead of handshaking again.
+
+    Args:
+        url (str): MCP endpoint URL
+
+    Returns:
+        MCPTools: Shared MCP toolset for that endpoint
+    """
+    return MCPTools(transport="streamable-http", url=url)
+
+
 def create_research_agent() -> Agent:
     """
     Factory function to create the Research Specialist Agent.
@@ -63,27 +85,41 @@ def create_research_agent() -> Agent:
     """
     config = get_config()
 
-    # Setup database connection
-    db = SqliteDb(db_file=config.database.db_file)
+    # Shared database connection (one engine/pool across all agents)
+    db = _get_db(config.database.db_file)
 
     # Configure MCP tools for research agent
     # Transport: streamable-http for HTTP-based MCP servers
     # URL comes from config (e.g., https://docs.agno.com/mcp)
-    mcp_tools = MCPTools(
-        transport="streamable-http",
-        url=getattr(config.agent, "mcp_url", "https://docs.agno.com/mcp"),
-    )
+    # Shared per URL so re-creation reuses the existing connection
+    mcp_tools = _get_mcp_tools(config.agent.mcp_url)
     
     # Create research agent with MCP tools
     return Agent(
-        id=RESEARCH_AGENT_CONFIG["db_table"],
-        name=RESEARCH_AGENT_CONFIG["name"],
+        id=RESEARCH_AGENT_CONFIG.db_table,
+        name=RESEARCH_AGENT_CONFIG.name,
         model=get_model(),
         db=db,
         tools=[mcp_tools],  # MCP tools for research capabilities
-        description=RESEARCH_AGENT_CONFIG["description"],
-        instructions=RESEARCH_AGENT_CONFIG["instructions"],
+        description=RESEARCH_AGENT_CONFIG.description,
+        # agno's system-message builder accepts str or list only; a
+        # tuple falls through both branches and is silently dropped
+        instructions=list(RESEARCH_AGENT_CONFIG.instructions),
         add_history_to_context=True,
         num_history_runs=3,
         markdown=True,
     )
+
+
+async def acreate_research_agent() -> Agent:
+    """
+    Async counterpart of create_research_agent().
+
+    Runs the blocking construction work (SQLite open, MCP client setup)
+    in a worker thread so the runtime can build all agents concurrently
+    at startup instead of serially.
+
+    Returns:
+        Agent: Research agent instance configured with MCP tools
+    """
+    return await asyncio.to_thread(create_research_agent)
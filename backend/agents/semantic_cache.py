@@ -0,0 +1,280 @@
+"""
+Semantic Query Cache Module
+
+In-process similarity cache for the Agno Assist agent's RAG pipeline.
+Repeated or near-duplicate questions ("What is Agno?", "what's agno?")
+normally re-run embedding + hybrid search + LLM generation every time.
+This cache short-circuits that path: if a new query's embedding is close
+enough (cosine similarity) to a previously answered query, the stored
+response is returned directly and both retrieval and generation are skipped.
+
+How it works:
+1. Embed the incoming query once (through the agent's shared embedder,
+   so its vector LRU and batching cover cache lookups too)
+2. Top-1 scan over cached query vectors (max 512 entries, in memory) —
+   one numpy matrix-vector product over unit-normalized rows
+3. Similarity >= 0.92 -> cache hit, return stored response
+4. Otherwise -> caller runs the agent, then stores (vector, response)
+
+Eviction:
+- Capacity-capped at CACHE_MAX_ENTRIES
+- Each entry keeps an EMA hit counter: c = (c_prev + hit - miss) / 2
+  so frequently re-matched entries survive eviction
+- Eviction removes the entry with the lowest (hit_count, timestamp)
+
+Thread safety:
+- All cache mutations are guarded by a lock so the sync and async
+  agent entry points can share one cache instance; the similarity
+  scan itself runs on a snapshot outside the lock so concurrent
+  lookups never serialize on it
+
+Usage:
+    from agents.semantic_cache import SemanticQueryCache
+
+    cache = SemanticQueryCache()
+    vector, cached = cache.get("What is Agno?")
+    if cached is not None:
+        return cached          # skip retrieval + LLM entirely
+    response = agent.run("What is Agno?")
+    cache.put("What is Agno?", vector, response)
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+from utils.hashing import hash_prompt
+
+# ============================================================================
+# Cache Tuning Constants
+# ============================================================================
+
+CACHE_SIMILARITY_THRESHOLD = 0.92  # Cosine similarity required for a hit
+CACHE_MAX_ENTRIES = 512            # Hard cap before eviction kicks in
+
+# Fallback embedder for caches constructed without one. Agent wiring
+# should pass the agent's own (micro-batching) embedder instead, so
+# cache lookups share its vector LRU and each query is embedded once.
+_query_embedder: Optional[OpenAIEmbedder] = None
+
+
+def get_query_embedder() -> OpenAIEmbedder:
+    """
+    Get the shared fallback query embedder instance.
+
+    The embedder is created once and reused for every cache lookup so
+    all queries go through a single OpenAI client / connection pool.
+
+    Returns:
+        OpenAIEmbedder: Shared text-embedding-3-small embedder
+    """
+    global _query_embedder
+    if _query_embedder is None:
+        _query_embedder = OpenAIEmbedder(id="text-embedding-3-small")
+    return _query_embedder
+
+
+@dataclass
+class CacheEntry:
+    """
+    Single cached (query embedding, agent response) pair.
+
+    Attributes:
+        vector: Query embedding (unit-normalized float32 numpy array)
+        response: Full agent response object returned on a hit
+        key: 16-byte prompt hash for the exact-match fast path
+        hit_count: EMA popularity score used for eviction ordering
+        ts: Last-touched timestamp (LRU tiebreaker)
+    """
+
+    vector: np.ndarray
+    response: Any
+    key: Optional[bytes] = None
+    hit_count: float = 1.0
+    ts: float = field(default_factory=time.time)
+
+
+def _normalize(raw: List[float]) -> np.ndarray:
+    """
+    Convert an embedding to a unit-normalized float32 numpy vector.
+
+    With unit rows, cosine similarity reduces to a dot product, so the
+    top-1 scan is a single matrix-vector multiply.
+
+    Args:
+        raw: Embedding as returned by the embedder
+
+    Returns:
+        np.ndarray: Unit vector (unchanged if degenerate/zero-norm)
+    """
+    vector = np.asarray(raw, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm > 0.0:
+        vector = vector / norm
+    return vector
+
+
+class SemanticQueryCache:
+    """
+    Similarity cache keyed on query embeddings.
+
+    Designed as a thin middleware in front of `agent.run()`:
+    - `get(query)` embeds the query and returns (vector, cached_response)
+    - `put(query, vector, response)` stores the triple after a cache miss
+
+    The vector returned by `get()` is passed back to `put()` so the
+    embedding is computed exactly once per query, hit or miss.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[OpenAIEmbedder] = None,
+        threshold: float = CACHE_SIMILARITY_THRESHOLD,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embedder: Embedder for query vectors (default: shared module-global)
+            threshold: Minimum cosine similarity for a hit (default: 0.92)
+            max_entries: Capacity cap before score-based eviction (default: 512)
+        """
+        self._embedder = embedder
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._entries: List[CacheEntry] = []
+        # Exact-match fast path: 16-byte prompt hash -> entry.
+        # Verbatim repeats skip both the embedding call and the cosine
+        # scan; the fixed-width key keeps dict probes O(1) regardless of
+        # prompt length.
+        self._by_hash: dict = {}
+        # Stacked (n_entries, dim) matrix of the entry vectors, rebuilt
+        # lazily after mutations so the scan is one numpy matmul
+        self._matrix: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def _get_embedder(self) -> OpenAIEmbedder:
+        """Return the configured embedder, defaulting to the shared one."""
+        if self._embedder is None:
+            self._embedder = get_query_embedder()
+        return self._embedder
+
+    def _embed(self, query: str) -> Optional[np.ndarray]:
+        """
+        Embed a query string, returning None if embedding fails.
+
+        Embedding failures (missing API key, network errors) must never
+        break the agent — the caller simply bypasses the cache.
+        """
+        try:
+            return _normalize(self._get_embedder().get_embedding(query))
+        except Exception:
+            return None
+
+    def get(self, query: str) -> Tuple[Optional[List[float]], Optional[Any]]:
+        """
+        Look up a query in the cache.
+
+        Verbatim repeats hit the exact-match hash map first, skipping
+        both the embedding call and the similarity scan. Otherwise the
+        query is embedded once and matched with a top-1 scan — a single
+        numpy matrix-vector product over unit-normalized rows, run on a
+        snapshot outside the lock so concurrent lookups don't serialize
+        on it. On a hit, the matched entry's EMA hit counter is bumped
+        with c = (c_prev + 1) / 2; on a near-miss (best candidate below
+        the threshold) the candidate is decayed with c = (c_prev - 1) / 2
+        so stale entries drift toward eviction.
+
+        Args:
+            query: User query string
+
+        Returns:
+            Tuple of (query vector or None, cached response or None).
+            The vector should be passed to `put()` after a miss.
+        """
+        key = hash_prompt(query)
+        with self._lock:
+            entry = self._by_hash.get(key)
+            if entry is not None:
+                entry.hit_count = (entry.hit_count + 1.0) / 2.0
+                entry.ts = time.time()
+                return entry.vector, entry.response
+
+        vector = self._embed(query)
+        if vector is None:
+            return None, None
+
+        # Snapshot the entries and their stacked matrix under the lock,
+        # then score outside it
+        with self._lock:
+            if not self._entries:
+                return vector, None
+            if self._matrix is None:
+                self._matrix = np.vstack([e.vector for e in self._entries])
+            matrix = self._matrix
+            entries = list(self._entries)
+
+        scores = matrix @ vector
+        best_index = int(np.argmax(scores))
+        best = entries[best_index]
+        best_score = float(scores[best_index])
+
+        with self._lock:
+            if best_score >= self._threshold:
+                # EMA update on hit: frequently matched entries survive eviction
+                best.hit_count = (best.hit_count + 1.0) / 2.0
+                best.ts = time.time()
+                return vector, best.response
+
+            # EMA update on miss for the closest candidate
+            best.hit_count = (best.hit_count - 1.0) / 2.0
+
+        return vector, None
+
+    def put(self, query: str, vector: Optional[np.ndarray], response: Any) -> None:
+        """
+        Store a (query, vector, response) triple after a cache miss.
+
+        Only successful runs are stored: agno surfaces model/tool errors
+        as error-status RunOutputs rather than raising, and caching one
+        would replay the failure for every similar query afterwards.
+        Responses without a status attribute are accepted as-is.
+
+        Evicts the lowest-scoring, least-recently-touched entry when
+        the cache is at capacity.
+
+        Args:
+            query: Original query text (hashed for the exact-match map)
+            vector: Query embedding from `get()` (no-op if None)
+            response: Agent response to replay on future hits
+        """
+        if vector is None or response is None:
+            return
+        status = getattr(response, "status", None)
+        if status is not None:
+            status_value = getattr(status, "value", status)
+            if str(status_value).lower() != "completed":
+                return
+
+        entry = CacheEntry(vector=vector, response=response, key=hash_prompt(query))
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                victim = min(self._entries, key=lambda e: (e.hit_count, e.ts))
+                self._entries.remove(victim)
+                self._by_hash.pop(victim.key, None)
+            self._entries.append(entry)
+            self._by_hash[entry.key] = entry
+            self._matrix = None  # Stale after mutation; rebuilt lazily
+
+    def clear(self) -> None:
+        """Drop all cached entries (primarily for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._by_hash.clear()
+            self._matrix = None
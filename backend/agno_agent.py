@@ -34,6 +34,14 @@ Environment Variables:
 
 from config import get_config, APP_NAME, APP_VERSION, APP_DESCRIPTION
 from core.runtime import create_runtime
+from utils import get_logger
+
+
+# Shared app logger: level from config, output via the background queue
+# listener. %s-style arguments keep message formatting lazy: under
+# LOG_LEVEL=warning the INFO lines below cost a level check and nothing
+# more.
+logger = get_logger(__name__)
 
 
 # Create runtime and get FastAPI app
@@ -42,39 +50,43 @@ app = runtime.get_app()
 
 
 if __name__ == "__main__":
-    
+
     # Load configuration from environment
     # This validates that OPENAI_API_KEY or ANTHROPIC_API_KEY is set
     config = get_config()
 
-    # Display startup banner with server information
-    banner = f"""
-====================================================================
-    Agno Smart Assistant - Single Responsibility MVP
-====================================================================
-  Web UI: http://{config.server.host}:{config.server.port}
-  API Docs: http://localhost:{config.server.port}/docs
-  Agents: Conversation + Research
-  DB: {config.database.db_file}
-  Model: {config.agent.model_id}
-====================================================================
-    """
-    print(banner)
+    # Startup information (formatted only when INFO is enabled)
+    logger.info("%s - Single Responsibility MVP", APP_NAME)
+    logger.info("Web UI: http://%s:%s", config.server.host, config.server.port)
+    logger.info("API Docs: http://localhost:%s/docs", config.server.port)
+    logger.info("Agents: Conversation + Research + Assist")
+    logger.info("DB: %s | Model: %s", config.database.db_file, config.agent.model_id)
 
     try:
         # Use uvicorn.run directly - agent_os.serve() causes shutdown issues
+        import importlib.util
         import uvicorn
+
+        # Prefer uvloop + httptools when installed (uvicorn[standard]);
+        # both fall back cleanly on platforms without them (e.g. Windows)
+        loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+        http = "httptools" if importlib.util.find_spec("httptools") else "auto"
+
         uvicorn.run(
-            app=app,
+            # Multi-worker mode needs an import string, not an app object
+            app="agno_agent:app" if config.server.workers > 1 else app,
             host=config.server.host,
             port=config.server.port,
             reload=False,
-            access_log=True,
+            loop=loop,
+            http=http,
+            workers=config.server.workers,
+            access_log=config.server.access_log,
         )
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully
-        print("\n✋ Server stopped by user")
+        logger.info("Server stopped by user")
     except Exception as e:
         # Handle other errors
-        print(f"❌ Error: {e}")
+        logger.error("Server error: %s", e)
         raise
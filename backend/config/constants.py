@@ -4,13 +4,12 @@ Application Constants
 Hardcoded values that don't change per environment.
 """
 
+from dataclasses import dataclass
+
 # ============================================================================
 # Application Info
 # ============================================================================
 
-from sqlalchemy import true
-
-
 APP_NAME = "Agno Smart Assistant"
 APP_VERSION = "1.0.0"
 APP_DESCRIPTION = "Multi-agent AI assistant powered by Agno"
@@ -21,6 +20,9 @@ APP_DESCRIPTION = "Multi-agent AI assistant powered by Agno"
 
 DEFAULT_DB_FILE = "agno.db"
 DEFAULT_VECTOR_DB_FILE = "vector.db"
+# Persistent LanceDB directory: survives restarts so the docs corpus is
+# not re-ingested and re-indexed on every cold start
+DEFAULT_VECTOR_DB_DIR = "data/lancedb"
 
 # ============================================================================
 # Model Defaults
@@ -43,50 +45,88 @@ DEFAULT_MCP_URL = "https://docs.agno.com/mcp"
 DEFAULT_PORT = 8000
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_LOG_LEVEL = "info"
+DEFAULT_WORKERS = 1
 
 # ============================================================================
 # Agent Configurations
 # ============================================================================
 
-CONVERSATION_AGENT_CONFIG = {
-    "name": "Agno Smart Assistant",
-    "description": "Main conversational agent with tool access",
-    "instructions": [
+@dataclass(frozen=True, slots=True)
+class AgentSpec:
+    """
+    Immutable per-agent configuration.
+
+    Frozen + slots replaces the previous plain dicts: attribute access
+    is a C-level slot lookup instead of a hash probe, instances carry no
+    __dict__, and immutability means the specs can safely be shared and
+    used as cache keys.
+
+    Dict-style access (spec["name"]) is kept for back-compat with any
+    external callers still using the old shape.
+    """
+
+    name: str
+    description: str
+    instructions: tuple
+    db_table: str
+    show_tool_calls: bool
+    add_datetime_to_context: bool
+    instructions_joined: str = ""  # Precomputed in __post_init__
+
+    def __post_init__(self):
+        """Precompute the joined system-prompt text once at construction."""
+        if not self.instructions_joined:
+            object.__setattr__(
+                self, "instructions_joined", "\n".join(self.instructions)
+            )
+
+    def __getitem__(self, key: str):
+        """Back-compat dict-style access: spec["name"] == spec.name."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+CONVERSATION_AGENT_CONFIG = AgentSpec(
+    name="Agno Smart Assistant",
+    description="Main conversational agent with tool access",
+    instructions=(
         "You are a helpful AI assistant powered by Agno.",
         "You have access to tools and can perform tasks.",
         "Always be concise, clear, and helpful.",
-    ],
-    "db_table": "agno-smart-assistant",  # Frontend uses this as ID
-    "show_tool_calls": True,
-    "add_datetime_to_context": True,
-}
-
-RESEARCH_AGENT_CONFIG = {
-    "name": "Research Agent",
-    "description": "Specialized agent for research and analysis",
-    "instructions": [
+    ),
+    db_table="agno-smart-assistant",  # Frontend uses this as ID
+    show_tool_calls=True,
+    add_datetime_to_context=True,
+)
+
+RESEARCH_AGENT_CONFIG = AgentSpec(
+    name="Research Agent",
+    description="Specialized agent for research and analysis",
+    instructions=(
         "You are a research specialist.",
         "Help users find, analyze, and synthesize information.",
         "Provide well-structured and detailed responses.",
-    ],
-    "db_table": "research-agent",  # Frontend uses this as ID
-    "show_tool_calls": True,
-    "add_datetime_to_context": False,
-}
-
-ASSIST_AGENT_CONFIG = {
-    "name": "Agno Assist",
-    "description": "Documentation assistant using RAG for Agno framework questions",
-    "instructions": [
+    ),
+    db_table="research-agent",  # Frontend uses this as ID
+    show_tool_calls=True,
+    add_datetime_to_context=False,
+)
+
+ASSIST_AGENT_CONFIG = AgentSpec(
+    name="Agno Assist",
+    description="Documentation assistant using RAG for Agno framework questions",
+    instructions=(
         "You help answer questions about the Agno framework.",
         "Search your knowledge before answering the question.",
         "Provide accurate answers grounded in the documentation.",
         "If information is not in the documentation, say so clearly.",
-    ],
-    "db_table": "assist-agent",  # Frontend uses this as ID
-    "show_tool_calls": True,
-    "add_datetime_to_context": True,
-}
+    ),
+    db_table="assist-agent",  # Frontend uses this as ID
+    show_tool_calls=True,
+    add_datetime_to_context=True,
+)
 
 # ============================================================================
 # UI Settings
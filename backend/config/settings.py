@@ -21,19 +21,40 @@ Usage:
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from functools import cache, lru_cache
 from typing import Optional
 from pathlib import Path
 
-# Load environment variables from .env file if it exists
-try:
-    from dotenv import load_dotenv
+
+@cache
+def _load_dotenv_once() -> None:
+    """
+    Load environment variables from the .env file, exactly once.
+
+    The functools.cache guard gives this Once semantics: no matter how
+    often the config is rebuilt (reset_config() in tests, reimports via
+    a different module path), the filesystem stat and file parse happen
+    a single time per process.
+
+    The file is parsed by hand — one read_text(), splitlines(), and a
+    partition per line — instead of going through python-dotenv's
+    regex tokenizer and object model. Our .env files only use the
+    simple KEY=value form, so this covers everything the examples ship
+    while dropping the dependency from the startup path. Existing
+    environment variables win over file values, matching the previous
+    load_dotenv(override=False) behavior.
+    """
     env_file = Path(__file__).parent.parent / ".env"
-    if env_file.exists():
-        load_dotenv(env_file)
-except ImportError:
-    # dotenv not installed, continue without loading .env
-    pass
+    if not env_file.exists():
+        return
+    for line in env_file.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, _, value = line.partition("=")
+        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+
 
 from config.constants import (
     APP_NAME,
@@ -41,15 +62,94 @@ from config.constants import (
     APP_DESCRIPTION,
     DEFAULT_DB_FILE,
     DEFAULT_VECTOR_DB_FILE,
+    DEFAULT_VECTOR_DB_DIR,
     DEFAULT_MODEL_ID,
     DEFAULT_MCP_URL,
     DEFAULT_PORT,
     DEFAULT_HOST,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_WORKERS,
 )
 
+def _mask(key: str) -> str:
+    """Mask a secret for display: last 4 chars only, or NOT SET."""
+    return f"***{key[-4:]}" if key else "***NOT SET"
+
+
+# Truthy values for boolean env vars. A frozenset gives an O(1) hash
+# lookup (vs. a linear tuple scan) and is built once at import.
+_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+# ----------------------------------------------------------------------------
+# Env-var casts and the table-driven from_env builder
+# ----------------------------------------------------------------------------
+#
+# Each sub-config declares an __env_map__ table:
+#     {field_name: (ENV_VAR, default)              # raw string field
+#      field_name: (ENV_VAR, default, cast)}       # parsed field
+# and its from_env delegates to _build_from_env, which walks the table
+# in one pass. Defaults are stored pre-typed, so the cast only runs
+# when the variable is actually set.
+
+
+def _to_bool(value: str) -> bool:
+    """Parse a boolean env var ("true"/"1"/"yes"/"on" are truthy)."""
+    return value.lower() in _TRUE
+
+
+def _to_port(value: str) -> int:
+    """
+    Parse a port number, falling back to the default on junk.
+
+    isdigit() instead of try/except int(): same junk-tolerant
+    semantics, without setting up an exception frame on every config
+    load.
+    """
+    return int(value) if value.isdigit() else DEFAULT_PORT
 
-@dataclass
+
+def _to_workers(value: str) -> int:
+    """Parse a worker count (minimum 1), falling back on junk."""
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+def _build_from_env(cls, env: Optional[dict] = None):
+    """
+    Construct a config dataclass from its __env_map__ table.
+
+    Args:
+        cls: Config class carrying an __env_map__ table
+        env: Environment snapshot (default: os.environ)
+
+    Returns:
+        Instance of cls with fields read from the environment
+    """
+    if env is None:
+        env = os.environ
+    kwargs = {}
+    for field_name, spec in cls.__env_map__.items():
+        raw = env.get(spec[0])
+        if raw is None:
+            kwargs[field_name] = spec[1]
+        elif len(spec) > 2:
+            kwargs[field_name] = spec[2](raw)
+        else:
+            kwargs[field_name] = raw
+    return cls(**kwargs)
+
+# Default model IDs by provider, hoisted so ModelConfig.from_env does
+# not rebuild the dict on every call.
+_DEFAULT_MODELS = {
+    "openai": "gpt-4",
+    "anthropic": "claude-3-5-sonnet-20241022",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class OpenAIConfig:
     """
     OpenAI API Configuration
@@ -58,24 +158,34 @@ class OpenAIConfig:
     """
 
     api_key: str  # OpenAI API key (secret)
+    masked_api_key: str = field(init=False, default="")  # Display form, precomputed
+
+    __env_map__ = {
+        "api_key": ("OPENAI_API_KEY", ""),
+    }
+
+    def __post_init__(self):
+        """Precompute the display-safe masked key once at construction."""
+        object.__setattr__(self, "masked_api_key", _mask(self.api_key))
 
     @staticmethod
-    def from_env() -> "OpenAIConfig":
+    def from_env(env: Optional[dict] = None) -> "OpenAIConfig":
         """
         Load OpenAI configuration from environment variables.
-        
+
         Optional: OPENAI_API_KEY environment variable
         Not required if using Anthropic provider
-        
+
+        Args:
+            env: Environment snapshot (default: os.environ)
+
         Returns:
             OpenAIConfig: Loaded configuration (empty if not set)
         """
-        return OpenAIConfig(
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
+        return _build_from_env(OpenAIConfig, env)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnthropicConfig:
     """
     Anthropic API Configuration
@@ -84,24 +194,34 @@ class AnthropicConfig:
     """
 
     api_key: str  # Anthropic API key (secret)
+    masked_api_key: str = field(init=False, default="")  # Display form, precomputed
+
+    __env_map__ = {
+        "api_key": ("ANTHROPIC_API_KEY", ""),
+    }
+
+    def __post_init__(self):
+        """Precompute the display-safe masked key once at construction."""
+        object.__setattr__(self, "masked_api_key", _mask(self.api_key))
 
     @staticmethod
-    def from_env() -> "AnthropicConfig":
+    def from_env(env: Optional[dict] = None) -> "AnthropicConfig":
         """
         Load Anthropic configuration from environment variables.
-        
+
         Optional: ANTHROPIC_API_KEY environment variable
         Not required if using OpenAI provider
-        
+
+        Args:
+            env: Environment snapshot (default: os.environ)
+
         Returns:
             AnthropicConfig: Loaded configuration (empty if not set)
         """
-        return AnthropicConfig(
-            api_key=os.getenv("ANTHROPIC_API_KEY", "")
-        )
+        return _build_from_env(AnthropicConfig, env)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """
     Database Configuration
@@ -110,28 +230,36 @@ class DatabaseConfig:
     and vector embeddings.
     """
 
-    db_file: str        # SQLite database file (conversations)
+    db_file: str         # SQLite database file (conversations)
     vector_db_file: str  # Vector database file (embeddings)
+    vector_db_dir: str   # LanceDB directory (persistent, survives restarts)
+
+    __env_map__ = {
+        "db_file": ("AGNO_DB_FILE", DEFAULT_DB_FILE),
+        "vector_db_file": ("VECTOR_DB_FILE", DEFAULT_VECTOR_DB_FILE),
+        "vector_db_dir": ("VECTOR_DB_DIR", DEFAULT_VECTOR_DB_DIR),
+    }
 
     @staticmethod
-    def from_env() -> "DatabaseConfig":
+    def from_env(env: Optional[dict] = None) -> "DatabaseConfig":
         """
         Load database configuration from environment variables.
-        
+
         Environment Variables:
         - AGNO_DB_FILE: SQLite database file (default: agno.db)
         - VECTOR_DB_FILE: Vector database file (default: vector.db)
-        
+        - VECTOR_DB_DIR: LanceDB directory (default: data/lancedb)
+
+        Args:
+            env: Environment snapshot (default: os.environ)
+
         Returns:
             DatabaseConfig: Loaded configuration with defaults
         """
-        return DatabaseConfig(
-            db_file=os.getenv("AGNO_DB_FILE", DEFAULT_DB_FILE),
-            vector_db_file=os.getenv("VECTOR_DB_FILE", DEFAULT_VECTOR_DB_FILE),
-        )
+        return _build_from_env(DatabaseConfig, env)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """
     Model Provider Configuration
@@ -144,37 +272,38 @@ class ModelConfig:
     model_id: str   # Model ID for the selected provider
 
     @staticmethod
-    def from_env() -> "ModelConfig":
+    def from_env(env: Optional[dict] = None) -> "ModelConfig":
         """
         Load model configuration from environment variables.
-        
+
         Environment Variables:
         - MODEL_PROVIDER: Provider to use (default: openai)
           Options: "openai", "anthropic"
         - MODEL_ID: Model ID (varies by provider)
           OpenAI: gpt-4, gpt-4-turbo, gpt-3.5-turbo, etc.
           Anthropic: claude-3-5-sonnet, claude-3-opus, etc.
-        
+
+        Args:
+            env: Environment snapshot (default: os.environ)
+
         Returns:
             ModelConfig: Loaded configuration with defaults
         """
-        provider = os.getenv("MODEL_PROVIDER", "openai").lower()
-        
-        # Default model IDs by provider
-        default_models = {
-            "openai": "gpt-4",
-            "anthropic": "claude-3-5-sonnet-20241022",
-        }
-        
-        model_id = os.getenv("MODEL_ID", default_models.get(provider, "gpt-4"))
-        
+        # Hand-written rather than table-driven: the MODEL_ID default
+        # depends on the value read for MODEL_PROVIDER
+        if env is None:
+            env = os.environ
+        provider = env.get("MODEL_PROVIDER", "openai").lower()
+
+        model_id = env.get("MODEL_ID", _DEFAULT_MODELS.get(provider, "gpt-4"))
+
         return ModelConfig(
             provider=provider,
             model_id=model_id,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """
     Agno Agent Configuration
@@ -184,27 +313,32 @@ class AgentConfig:
     """
 
     model_id: str   # Model ID (deprecated, use ModelConfig.model_id)
-    mcp_url: str    # Model Context Protocol endpoint URL
+    mcp_url: str = DEFAULT_MCP_URL  # Model Context Protocol endpoint URL
+
+    __env_map__ = {
+        "model_id": ("AGNO_MODEL_ID", DEFAULT_MODEL_ID),
+        "mcp_url": ("AGNO_MCP_URL", DEFAULT_MCP_URL),
+    }
 
     @staticmethod
-    def from_env() -> "AgentConfig":
+    def from_env(env: Optional[dict] = None) -> "AgentConfig":
         """
         Load agent configuration from environment variables.
-        
+
         Environment Variables:
         - AGNO_MODEL_ID: Model ID (default: gpt-4)
         - AGNO_MCP_URL: MCP endpoint (default: https://docs.agno.com/mcp)
-        
+
+        Args:
+            env: Environment snapshot (default: os.environ)
+
         Returns:
             AgentConfig: Loaded configuration with defaults
         """
-        return AgentConfig(
-            model_id=os.getenv("AGNO_MODEL_ID", DEFAULT_MODEL_ID),
-            mcp_url=os.getenv("AGNO_MCP_URL", DEFAULT_MCP_URL),
-        )
+        return _build_from_env(AgentConfig, env)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """
     HTTP Server Configuration
@@ -213,43 +347,71 @@ class ServerConfig:
     port, host, reload behavior, and logging.
     """
 
-    host: str       # Server hostname (0.0.0.0 = all interfaces)
-    port: int       # Server port (typically 8000)
-    reload: bool    # Auto-reload on code changes (development)
-    log_level: str  # Logging verbosity (info, debug, warning, error)
+    host: str        # Server hostname (0.0.0.0 = all interfaces)
+    port: int        # Server port (typically 8000)
+    reload: bool     # Auto-reload on code changes (development)
+    log_level: str   # Logging verbosity (info, debug, warning, error)
+    workers: int     # Worker process count (production CPU scaling)
+    access_log: bool # Per-request access logging (disable for high QPS)
+
+    __env_map__ = {
+        "host": ("HOST", DEFAULT_HOST),
+        "port": ("PORT", DEFAULT_PORT, _to_port),
+        "reload": ("RELOAD", True, _to_bool),
+        "log_level": ("LOG_LEVEL", DEFAULT_LOG_LEVEL),
+        "workers": ("WORKERS", DEFAULT_WORKERS, _to_workers),
+        "access_log": ("ACCESS_LOG", True, _to_bool),
+    }
 
     @staticmethod
-    def from_env() -> "ServerConfig":
+    def from_env(env: Optional[dict] = None) -> "ServerConfig":
         """
         Load server configuration from environment variables.
-        
+
         Environment Variables:
         - HOST: Server host (default: 0.0.0.0)
         - PORT: Server port (default: 8000)
         - RELOAD: Auto-reload (default: true) - set to false in production
         - LOG_LEVEL: Log level (default: info)
-        
+        - WORKERS: Worker processes (default: 1)
+        - ACCESS_LOG: Access logging (default: true) - disabling saves
+          ~10% CPU at high request rates
+
+        Args:
+            env: Environment snapshot (default: os.environ)
+
         Returns:
             ServerConfig: Loaded configuration with defaults
         """
-        reload_str = os.getenv("RELOAD", "true").lower()
-        reload = reload_str in ("true", "1", "yes")
-
-        port_str = os.getenv("PORT", str(DEFAULT_PORT))
-        try:
-            port = int(port_str)
-        except ValueError:
-            port = DEFAULT_PORT
-
-        return ServerConfig(
-            host=os.getenv("HOST", DEFAULT_HOST),
-            port=port,
-            reload=reload,
-            log_level=os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL),
-        )
+        return _build_from_env(ServerConfig, env)
+
+
+# Flattened env spec, precompiled at import from the per-class
+# __env_map__ tables: (attr on AppConfig, config class, field specs),
+# each field spec normalized to (field, ENV_VAR, default, cast-or-None).
+# AppConfig.from_env walks this once per build instead of dispatching
+# through the individual from_env methods. ModelConfig is absent — its
+# provider-dependent default keeps it on the hand-written path.
+_ENV_SPEC = tuple(
+    (
+        attr,
+        cls,
+        tuple(
+            (field_name, spec[0], spec[1], spec[2] if len(spec) > 2 else None)
+            for field_name, spec in cls.__env_map__.items()
+        ),
+    )
+    for attr, cls in (
+        ("openai", OpenAIConfig),
+        ("anthropic", AnthropicConfig),
+        ("database", DatabaseConfig),
+        ("agent", AgentConfig),
+        ("server", ServerConfig),
+    )
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """
     Complete Application Configuration
@@ -263,32 +425,28 @@ class AppConfig:
     name: str = APP_NAME
     version: str = APP_VERSION
     description: str = APP_DESCRIPTION
-    openai: OpenAIConfig = None             # OpenAI API settings
-    anthropic: AnthropicConfig = None       # Anthropic API settings
-    model: ModelConfig = None               # Model provider selection
-    database: DatabaseConfig = None         # Database settings
-    agent: AgentConfig = None               # Agent runtime settings
-    server: ServerConfig = None             # HTTP server settings
 
-    def __post_init__(self):
+    # Sub-configs default to their own from_env factories. The
+    # default_factory only runs for fields the caller omits, so direct
+    # AppConfig() still works while from_env() — which passes every
+    # field — pays no None-check or re-initialization cost. Validation
+    # lives in the factory path, not __post_init__.
+    openai: OpenAIConfig = field(default_factory=OpenAIConfig.from_env)
+    anthropic: AnthropicConfig = field(default_factory=AnthropicConfig.from_env)
+    model: ModelConfig = field(default_factory=ModelConfig.from_env)
+    database: DatabaseConfig = field(default_factory=DatabaseConfig.from_env)
+    agent: AgentConfig = field(default_factory=AgentConfig.from_env)
+    server: ServerConfig = field(default_factory=ServerConfig.from_env)
+
+    def _validate(self) -> None:
         """
-        Initialize sub-configurations if not provided.
-        This is called automatically after dataclass initialization.
+        Validate the assembled configuration.
+
+        At least one API key must be provided.
+
+        Raises:
+            ValueError: If no API key is configured
         """
-        if self.openai is None:
-            self.openai = OpenAIConfig.from_env()
-        if self.anthropic is None:
-            self.anthropic = AnthropicConfig.from_env()
-        if self.model is None:
-            self.model = ModelConfig.from_env()
-        if self.database is None:
-            self.database = DatabaseConfig.from_env()
-        if self.agent is None:
-            self.agent = AgentConfig.from_env()
-        if self.server is None:
-            self.server = ServerConfig.from_env()
-        
-        # Validate: At least one API key must be provided
         if not self.openai.api_key and not self.anthropic.api_key:
             raise ValueError(
                 "❌ No API key configured.\n"
@@ -296,28 +454,64 @@ class AppConfig:
                 "   Current provider: " + self.model.provider
             )
 
+    @classmethod
+    def _fast_new(cls, **fields) -> "AppConfig":
+        """
+        Construct an AppConfig without going through dataclass __init__.
+
+        The generated __init__ dispatches a __setattr__ per field —
+        pure overhead when the caller (from_env) already has every
+        sub-config in hand. This assigns the slots directly via
+        object.__setattr__. Callers must run _validate() themselves.
+
+        Args:
+            **fields: Field values; app metadata defaults are filled in
+
+        Returns:
+            AppConfig: Constructed (unvalidated) instance
+        """
+        fields.setdefault("name", APP_NAME)
+        fields.setdefault("version", APP_VERSION)
+        fields.setdefault("description", APP_DESCRIPTION)
+        config = object.__new__(cls)
+        for field_name, value in fields.items():
+            object.__setattr__(config, field_name, value)
+        return config
+
     @staticmethod
     def from_env() -> "AppConfig":
         """
         Load complete configuration from environment variables.
-        
+
         This is the main factory method for creating the app config.
-        It loads all sub-configurations and validates them.
-        
+        It snapshots os.environ into a plain dict once, then builds
+        every sub-config in a single traversal of the precompiled
+        _ENV_SPEC table: read, cast, assign per variable — no
+        per-sub-config method dispatch and no repeated os.environ
+        encode/decode.
+
         Returns:
             AppConfig: Complete application configuration
-            
+
         Raises:
             ValueError: If required settings are missing
         """
-        return AppConfig(
-            openai=OpenAIConfig.from_env(),
-            anthropic=AnthropicConfig.from_env(),
-            model=ModelConfig.from_env(),
-            database=DatabaseConfig.from_env(),
-            agent=AgentConfig.from_env(),
-            server=ServerConfig.from_env(),
-        )
+        env = dict(os.environ)
+        subs = {}
+        for attr, cls, field_specs in _ENV_SPEC:
+            kwargs = {}
+            for field_name, var, default, cast in field_specs:
+                raw = env.get(var)
+                if raw is None:
+                    kwargs[field_name] = default
+                else:
+                    kwargs[field_name] = cast(raw) if cast else raw
+            subs[attr] = cls(**kwargs)
+        subs["model"] = ModelConfig.from_env(env)
+
+        config = AppConfig._fast_new(**subs)
+        config._validate()
+        return config
 
     def to_dict(self) -> dict:
         """
@@ -329,73 +523,80 @@ class AppConfig:
         Returns:
             dict: Configuration as nested dictionary
         """
-        return {
-            "app": {
-                "name": self.name,
-                "version": self.version,
-                "description": self.description,
-            },
-            "model": {
-                "provider": self.model.provider,
-                "model_id": self.model.model_id,
-            },
-            "openai": {"api_key": "***" + (self.openai.api_key[-4:] if self.openai.api_key else "NOT SET")},
-            "anthropic": {"api_key": "***" + (self.anthropic.api_key[-4:] if self.anthropic.api_key else "NOT SET")},
-            "database": {
-                "db_file": self.database.db_file,
-                "vector_db_file": self.database.vector_db_file,
-            },
-            "agent": {
-                "model_id": self.agent.model_id,
-                "mcp_url": self.agent.mcp_url,
-            },
-            "server": {
-                "host": self.server.host,
-                "port": self.server.port,
-                "reload": self.server.reload,
-                "log_level": self.server.log_level,
-            },
+        # asdict() does the recursive copy in one C-optimized pass;
+        # the app metadata fields are regrouped and the raw secrets
+        # swapped for the masked forms precomputed at construction,
+        # instead of hand-building seven dict literals.
+        d = asdict(self)
+        d["app"] = {
+            "name": d.pop("name"),
+            "version": d.pop("version"),
+            "description": d.pop("description"),
         }
+        d["openai"]["api_key"] = d["openai"].pop("masked_api_key")
+        d["anthropic"]["api_key"] = d["anthropic"].pop("masked_api_key")
+        return d
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the (masked) configuration straight to JSON bytes.
+
+        For endpoints that return the config, this skips FastAPI's
+        jsonable_encoder/stdlib-json round trip: hand the bytes to
+        Response(content=..., media_type="application/json") directly.
+        Uses orjson when installed (same optional dependency as the
+        runtime's ORJSONResponse), stdlib json otherwise.
+
+        Returns:
+            bytes: UTF-8 JSON encoding of to_dict()
+        """
+        d = self.to_dict()
+        try:
+            import orjson
+
+            return orjson.dumps(d)
+        except ImportError:
+            import json
+
+            return json.dumps(d).encode("utf-8")
 
 
 # ============================================================================
 # Global Configuration Instance (Singleton Pattern)
 # ============================================================================
 
-_config: Optional[AppConfig] = None
-
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """
     Get or initialize the global configuration instance.
-    
-    This implements the Singleton pattern:
+
+    This implements the Singleton pattern via lru_cache:
     - First call creates config from environment
-    - Subsequent calls return the same instance
-    - Ensures configuration is loaded only once
-    
+    - Subsequent calls return the same instance from lru_cache's
+      C implementation — no Python-level branch or global lookup,
+      which matters because get_config() sits on per-call paths
+      like get_logger()
+
     Returns:
         AppConfig: Global configuration instance
-        
+
     Example:
         >>> config = get_config()
         >>> print(config.server.port)
         8000
     """
-    global _config
-    if _config is None:
-        _config = AppConfig.from_env()
-    return _config
+    _load_dotenv_once()
+    return AppConfig.from_env()
 
 
 def reset_config() -> None:
     """
     Reset configuration (primarily for testing).
-    
-    This clears the global config instance so that
+
+    This clears the cached config instance so that
     the next call to get_config() will reload from environment.
-    
+
     Only use this in testing or when environment variables change.
     """
-    global _config
-    _config = None
+    get_config.cache_clear()
@@ -3,8 +3,10 @@ Utils Module
 
 Exports:
 - get_logger(): Get configured logger instance
+- hash_prompt(): Fixed-width lookup key for prompt text
 """
 
 from utils.logger import get_logger
+from utils.hashing import hash_prompt
 
-__all__ = ["get_logger"]
+__all__ = ["get_logger", "hash_prompt"]
@@ -8,6 +8,7 @@ Features:
 - Consistent formatting across all modules
 - Log level from application config
 - Stream output to stdout (visible in terminal)
+- Non-blocking emit: records are queued and written by a background thread
 - One-time handler setup per logger
 
 Usage:
@@ -18,20 +19,77 @@ Usage:
     logger.error("Something went wrong")
 """
 
+import atexit
 import logging
+import queue
 import sys
+from functools import cache, lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 from config import get_config
 
+# None of our log output uses thread/process fields, so skip collecting
+# them — each flag removes a syscall or lookup from every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
+
+# All loggers enqueue records here; a single background listener
+# thread drains the queue and does the actual stdout writes
+_log_queue = queue.SimpleQueue()
+
+
+@cache
+def _start_listener() -> None:
+    """
+    Start the background log-writing thread, exactly once.
+
+    Handlers created by get_logger() only enqueue records (~sub-µs, no
+    syscall); the QueueListener formats and writes them on its own
+    thread. This keeps stdout write() — a blocking syscall — out of
+    request handlers and the event loop. Stopped at interpreter exit so
+    pending records are flushed.
+    """
+    # Format: [LEVEL] module_name - message
+    # Example: [INFO] config.settings - Configuration loaded
+    # {-style formats faster than %-style per record; no datefmt
+    # since the format string never references asctime
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("[{levelname}] {name} - {message}", style="{")
+    )
+    listener = QueueListener(_log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+@lru_cache(maxsize=1)
+def _default_level() -> str:
+    """
+    Resolve the configured log level string once per process.
+
+    Reading config.server.log_level and upper-casing it on every
+    get_logger() call is wasted work — the level cannot change after
+    startup. Cached so the config lookup and string work happen a
+    single time.
+    """
+    return get_config().server.log_level.upper()
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     """
     Get a configured logger instance.
     
     Creates or retrieves a logger with consistent formatting and configuration.
     Each logger is set up only once to avoid duplicate handlers.
-    
+
+    Memoized per (name, level): repeat calls return the cached Logger
+    directly, skipping the config lookup and the global lock taken by
+    logging.Logger.manager.getLogger.
+
     Args:
         name (str): Logger name, typically __name__ from the calling module.
                     This becomes the logger's prefix in output.
@@ -51,30 +109,27 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
         [LEVEL] module_name - message
         Example: [INFO] myapp.agents - Agent initialized
     """
-    config = get_config()
-
     logger = logging.getLogger(name)
 
     # Set up handler only if not already configured
     # This prevents duplicate handlers from being added
     if not logger.handlers:
-        # Create handler that outputs to stdout (terminal)
-        handler = logging.StreamHandler(sys.stdout)
+        _start_listener()
 
-        # Use provided level or load from config
-        log_level = level or config.server.log_level.upper()
-        handler.setLevel(log_level)
+        # Log sites only enqueue; the shared listener thread formats
+        # and writes to stdout
+        handler = QueueHandler(_log_queue)
 
-        # Format: [LEVEL] module_name - message
-        # Example: [INFO] config.settings - Configuration loaded
-        formatter = logging.Formatter(
-            "[%(levelname)s] %(name)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
+        # Use provided level or the cached config default
+        log_level = level or _default_level()
+        handler.setLevel(log_level)
 
         # Attach handler to logger
         logger.addHandler(handler)
         logger.setLevel(log_level)
+        # This logger has its own handler; without this, a configured
+        # root logger (e.g. via basicConfig) would emit every record a
+        # second time
+        logger.propagate = False
 
     return logger